@@ -14,6 +14,6 @@ if __name__ == "__main__":
     number = args.number
 
     logger.info("-" * 50)
-    logger.info(f"Input number: {number}")
-    logger.info(f"Output number: {random_sum(number)}")
+    logger.info("Input number: %s", number)
+    logger.info("Output number: %s", random_sum(number))
     logger.info("-" * 50)
@@ -0,0 +1,190 @@
+import json
+import logging
+import subprocess
+from collections.abc import Iterator
+from pathlib import Path
+
+import mlflow
+import pytest
+from mlflow.exceptions import MlflowException
+
+from utils.configs import MlflowLoggerConfig
+from utils.experiment_logger import MlflowLogger
+
+
+def git(cwd: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    git(repo, "init", "-b", "main")
+    git(repo, "commit", "--allow-empty", "-m", "initial")
+    return repo
+
+
+def test_read_git_head_branch(repo, monkeypatch):
+    (repo / "sub").mkdir()
+    monkeypatch.chdir(repo / "sub")
+    assert MlflowLogger._read_git_head() == (git(repo, "rev-parse", "HEAD"), "main")
+
+
+def test_read_git_head_detached(repo, monkeypatch):
+    git(repo, "checkout", "--detach")
+    monkeypatch.chdir(repo)
+    assert MlflowLogger._read_git_head() == (git(repo, "rev-parse", "HEAD"), None)
+
+
+def test_read_git_head_packed_refs(repo, monkeypatch):
+    git(repo, "pack-refs", "--all")
+    assert not (repo / ".git" / "refs" / "heads" / "main").exists()
+    monkeypatch.chdir(repo)
+    assert MlflowLogger._read_git_head() == (git(repo, "rev-parse", "HEAD"), "main")
+
+
+@pytest.mark.parametrize("pack_refs", [False, True])
+def test_read_git_head_worktree(repo, tmp_path, monkeypatch, pack_refs):
+    worktree = tmp_path / "wt"
+    git(repo, "worktree", "add", str(worktree), "-b", "feature/x")
+    if pack_refs:
+        git(repo, "pack-refs", "--all")
+    monkeypatch.chdir(worktree)
+    assert MlflowLogger._read_git_head() == (git(worktree, "rev-parse", "HEAD"), "feature/x")
+
+
+def test_read_git_head_missing_gitdir(repo, monkeypatch):
+    nested = repo / "nested"
+    nested.mkdir()
+    (nested / ".git").write_text("gitdir: ../does-not-exist\n")
+    monkeypatch.chdir(nested)
+    assert MlflowLogger._read_git_head() == (None, None)
+
+
+@pytest.fixture(scope="module")
+def tracking_uri(tmp_path_factory) -> Iterator[str]:
+    # Creating a sqlite store is slow, so it is shared by the tests of this module.
+    # Its artifacts default to a directory under the cwd at creation time.
+    store_dir = tmp_path_factory.mktemp("mlflow")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(store_dir)
+        yield f"sqlite:///{store_dir / 'mlflow.db'}"
+
+
+@pytest.fixture
+def mlflow_logger(tracking_uri) -> MlflowLogger:
+    config = MlflowLoggerConfig.model_construct(
+        tracking_uri=tracking_uri, project_name="test", experiment_name="test"
+    )
+    return MlflowLogger(config)
+
+
+def test_log_record_splits_metrics_and_params(mlflow_logger):
+    with mlflow_logger:
+        run_id = mlflow_logger._run_id
+        mlflow_logger.log_record(
+            {"acc": 0.9, "n": 3, "flag": True, "split": "eval", "labels": {1: "a"}}
+        )
+    data = mlflow_logger._client.get_run(run_id).data
+    assert data.metrics == {"acc": 0.9, "n": 3.0}
+    assert data.params == {"flag": "true", "split": "eval", "labels": '{"1":"a"}'}
+
+
+def test_log_record_without_run_is_ignored(mlflow_logger, caplog):
+    with caplog.at_level(logging.WARNING):
+        mlflow_logger.log_record({"acc": 0.9})
+    assert "'log_record' call ignored" in caplog.text
+
+
+def test_log_record_raises_on_rejected_batch(mlflow_logger):
+    with mlflow_logger:
+        mlflow_logger.log_record({"split": "train"})
+        with pytest.raises(MlflowException):
+            mlflow_logger.log_record({"split": "eval"})
+
+
+def test_log_local_directory_prefixes_single_record_keys(mlflow_logger, tmp_path):
+    local_dir = tmp_path / "data"
+    for split, acc in (("train", 0.8), ("eval", 0.9)):
+        (local_dir / split).mkdir(parents=True)
+        (local_dir / split / "m.json").write_text(json.dumps({"acc": acc, "split": split}))
+    with mlflow_logger:
+        run_id = mlflow_logger._run_id
+        mlflow_logger.log_local_directory(local_dir)
+    client = mlflow_logger._client
+    data = client.get_run(run_id).data
+    assert data.metrics == {"train/m/acc": 0.8, "eval/m/acc": 0.9}
+    assert data.params == {"train/m/split": "train", "eval/m/split": "eval"}
+    for split in ("train", "eval"):
+        assert [a.path for a in client.list_artifacts(run_id, split)] == [f"{split}/m.json"]
+
+
+@pytest.fixture
+def local_dir(tmp_path) -> Path:
+    local_dir = tmp_path / "artifacts"
+    local_dir.mkdir()
+    for name in ("a.txt", "b.txt"):
+        (local_dir / name).write_text(name)
+    return local_dir
+
+
+@pytest.fixture
+def failing_uploads(mlflow_logger, monkeypatch) -> None:
+    def log_artifact(run_id, local_path, artifact_path=None):
+        raise OSError(f"cannot upload {local_path}")
+
+    monkeypatch.setattr(mlflow_logger._client, "log_artifact", log_artifact)
+
+
+def test_log_local_directory_waits_for_uploads(mlflow_logger, local_dir):
+    with mlflow_logger:
+        run_id = mlflow_logger._run_id
+        mlflow_logger.log_local_directory(local_dir)
+        assert [a.path for a in mlflow_logger._client.list_artifacts(run_id)] == ["a.txt", "b.txt"]
+    assert mlflow_logger._upload_executor is None
+
+
+def test_log_local_directory_defers_uploads_to_exit(mlflow_logger, local_dir):
+    with mlflow_logger:
+        run_id = mlflow_logger._run_id
+        mlflow_logger.log_local_directory(local_dir, wait=False)
+    client = mlflow_logger._client
+    assert [a.path for a in client.list_artifacts(run_id)] == ["a.txt", "b.txt"]
+    assert client.get_run(run_id).info.status == "FINISHED"
+
+
+@pytest.mark.usefixtures("failing_uploads")
+def test_log_local_directory_raises_upload_error(mlflow_logger, local_dir):
+    with mlflow_logger:
+        with pytest.raises(OSError, match="cannot upload"):
+            mlflow_logger.log_local_directory(local_dir)
+
+
+@pytest.mark.usefixtures("failing_uploads")
+def test_deferred_upload_error_raises_from_exit(mlflow_logger, local_dir):
+    with pytest.raises(OSError, match="cannot upload"):
+        with mlflow_logger:
+            mlflow_logger.log_local_directory(local_dir, wait=False)
+    run = mlflow.last_active_run()
+    assert run is not None
+    assert run.info.status == "FAILED"
+    assert mlflow_logger._upload_executor is None
+
+
+@pytest.mark.usefixtures("failing_uploads")
+def test_deferred_upload_error_does_not_mask_body_error(mlflow_logger, local_dir):
+    with pytest.raises(ValueError, match="body"):
+        with mlflow_logger:
+            mlflow_logger.log_local_directory(local_dir, wait=False)
+            raise ValueError("body")
+    run = mlflow.last_active_run()
+    assert run is not None
+    assert run.info.status == "FAILED"
@@ -1,5 +1,7 @@
+import codecs
+from importlib.resources.abc import Traversable
 from pathlib import Path
-from typing import ClassVar, Self
+from typing import Any, ClassVar, Self, override
 
 import yaml
 from pydantic import AnyHttpUrl, BaseModel, ConfigDict, Field
@@ -10,6 +12,30 @@ from pydantic_settings import (
     YamlConfigSettingsSource,
 )
 
+# Prefer the libyaml-backed loader when PyYAML was built with it; the pure-Python
+# `SafeLoader` is the fallback and accepts exactly the same documents.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _load_yaml_file(path: str | Path | Traversable, encoding: str = "utf-8") -> Any:
+    """Parse a YAML file, handing the raw bytes to the loader when they are UTF-8.
+
+    The loaders decode UTF-8 input themselves, so this skips building an
+    intermediate `str` copy of the whole document.
+    """
+    raw = (Path(path) if isinstance(path, str) else path).read_bytes()
+    if codecs.lookup(encoding).name != "utf-8":
+        return yaml.load(raw.decode(encoding), Loader=_YamlLoader)
+    return yaml.load(raw, Loader=_YamlLoader)
+
+
+class CYamlConfigSettingsSource(YamlConfigSettingsSource):
+    """`YamlConfigSettingsSource` that parses files with `_load_yaml_file`."""
+
+    @override
+    def _read_file(self, file_path: Path | Traversable) -> dict[str, Any]:
+        return _load_yaml_file(file_path, self.yaml_file_encoding or "utf-8") or {}
+
 
 class YamlBaseSettings(BaseSettings):
     """Base for process-level settings layered over the environment.
@@ -40,7 +66,7 @@ class YamlBaseSettings(BaseSettings):
         yaml_path = cls.model_config.get("yaml_file", None)
         if yaml_path:
             sources += (
-                YamlConfigSettingsSource(
+                CYamlConfigSettingsSource(
                     settings_cls=settings_cls,
                     yaml_file=yaml_path,
                     yaml_file_encoding=cls.model_config.get("yaml_file_encoding", "utf-8"),
@@ -50,8 +76,7 @@ class YamlBaseSettings(BaseSettings):
 
     @classmethod
     def from_yaml(cls, file_path: str | Path):
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = _load_yaml_file(file_path)
         return cls(**data)
 
     def to_yaml(self, file_path: str | Path):
@@ -94,7 +119,7 @@ class YamlBaseModel(BaseModel):
                     "a path must be provided to from_yaml()."
                 )
             path = cls.DEFAULT_CONFIG_PATH
-        data = yaml.safe_load(Path(path).read_text(encoding="utf-8")) or {}
+        data = _load_yaml_file(path) or {}
         return cls.model_validate(data)
 
     def to_yaml(self, path: str | Path) -> None:
@@ -1,22 +1,35 @@
-from functools import cached_property
+from functools import cached_property, lru_cache
 
 from utils.configs import GlobalConfig, MlflowLoggerConfig
 from utils.singleton import SingletonMeta
 
 
+@lru_cache(maxsize=1)
+def _load_global_config() -> GlobalConfig:
+    return GlobalConfig()
+
+
+@lru_cache(maxsize=1)
+def _load_mlflow_configs() -> MlflowLoggerConfig:
+    return MlflowLoggerConfig.from_yaml()
+
+
 class BaseConfigProvider(metaclass=SingletonMeta):
     """Singleton class to provide configs for the application.
 
     Each config is loaded lazily on first access and cached, so a missing or
-    invalid file for one config does not break access to the others.
+    invalid file for one config does not break access to the others. The
+    loaded configs are memoized at module scope, so resetting the singleton
+    (e.g. between tests) does not re-read and re-validate the YAML files;
+    call `cache_clear()` on the loaders to force a reload.
     """
 
     @cached_property
     def global_config(self) -> GlobalConfig:
         """Global configuration settings."""
-        return GlobalConfig()
+        return _load_global_config()
 
     @cached_property
     def mlflow_configs(self) -> MlflowLoggerConfig:
         """MLflow logger configuration settings, loaded from the default file."""
-        return MlflowLoggerConfig.from_yaml()
+        return _load_mlflow_configs()
@@ -4,22 +4,52 @@ import functools
 import importlib.metadata
 import logging
 import os
-import tempfile
+import time
 import uuid
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, override
+from typing import TYPE_CHECKING, Any, ClassVar, override
 
-import dotenv
-import mlflow
-import mlflow.data.polars_dataset
-import polars as pl
+import orjson
 
 from utils.configs import MlflowLoggerConfig
 
+# `mlflow`, `polars` and `dotenv` are imported where they are used, so that
+# importing this module stays cheap for code paths that never log. `mlflow` is
+# bound at module scope by `MlflowLogger._configure_tracking`, so the instance
+# methods can use it without importing it again.
+if TYPE_CHECKING:
+    import mlflow
+    import polars as pl
+
 logger = logging.getLogger(__name__)
 
+# Match `json.dumps` for param values: non-string dict keys are coerced to strings.
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+@functools.lru_cache(maxsize=1)
+def _load_dotenv_once() -> None:
+    """Load `.env` into the environment the first time a logger is configured."""
+    import dotenv
+
+    dotenv.load_dotenv(override=True)
+
+
+@functools.lru_cache(maxsize=1)
+def _dataframe_readers() -> dict[str, Callable[[Path], pl.DataFrame]]:
+    """Return the readers for the input formats supported by `MlflowLogger.log_input`."""
+    import polars as pl
+
+    return {
+        ".json": pl.read_json,
+        ".csv": pl.read_csv,
+        ".parquet": pl.read_parquet,
+    }
+
 
 class BaseExperimentLogger(ABC):
     """Abstract base class for experiment logging."""
@@ -44,32 +74,64 @@ class BaseExperimentLogger(ABC):
 class MlflowLogger(BaseExperimentLogger):
     """MLflow-backed experiment logger."""
 
+    # Maximum number of background artifact uploads run concurrently.
+    _UPLOAD_WORKERS: ClassVar[int] = 8
+
     def __init__(self, config: MlflowLoggerConfig) -> None:
+        from mlflow.tracking import MlflowClient
+
         self._config = config
         self._experiment_name = config.experiment_name
         self._run_name = config.run_name
-        self._configure_tracking()
+        self._run_id: str | None = None
+        tracking_uri = self._configure_tracking()
+        self._client = MlflowClient(tracking_uri=tracking_uri)
+        # Suffix-specific handlers; a handler returning `False` falls back to a
+        # plain artifact upload.
+        self._file_handlers: dict[str, Callable[[str, Path, Path], bool]] = {
+            ".json": self._try_log_json_as_table,
+            ".jinja2": self._log_jinja_as_text,
+        }
+        # Artifact uploads run on a per-run executor. Uploads deferred with
+        # `log_local_directory(..., wait=False)` are awaited in `__exit__`.
+        self._upload_executor: ThreadPoolExecutor | None = None
+        self._pending_uploads: list[tuple[Path, Future[None]]] = []
 
     @override
     def __enter__(self) -> MlflowLogger:
         if self._run_name is None:
             self._run_name = self._generate_run_name()
-        mlflow.start_run(run_name=self._run_name)
+        run = mlflow.start_run(run_name=self._run_name)
+        self._run_id = run.info.run_id
+        self._upload_executor = ThreadPoolExecutor(
+            max_workers=self._UPLOAD_WORKERS, thread_name_prefix="mlflow-upload"
+        )
         logger.info("Started MLflow run with name: %s", self._run_name)
-        active_run = mlflow.active_run()
-        if active_run is not None:
-            logger.info("Active run ID: %s", active_run.info.run_id)
+        logger.info("Active run ID: %s", self._run_id)
         self._log_run_metadata()
         return self
 
     @override
     def __exit__(self, exc_type, exc_value, traceback) -> None:
-        active_run = mlflow.active_run()
-        if active_run is not None:
+        if self._run_id is not None:
             logger.info("Result logged to MLflow.")
-            logger.info("MLflow run ID: %s", active_run.info.run_id)
-        status = "FAILED" if exc_type is not None else "FINISHED"
-        mlflow.end_run(status=status)
+            logger.info("MLflow run ID: %s", self._run_id)
+        pending, self._pending_uploads = self._pending_uploads, []
+        upload_error: Exception | None = None
+        try:
+            self._wait_for_uploads(pending)
+        except Exception as e:
+            upload_error = e
+        finally:
+            if self._upload_executor is not None:
+                self._upload_executor.shutdown()
+                self._upload_executor = None
+        failed = exc_type is not None or upload_error is not None
+        mlflow.end_run(status="FAILED" if failed else "FINISHED")
+        self._run_id = None
+        # Surface upload failures only if no other exception is propagating.
+        if upload_error is not None and exc_type is None:
+            raise upload_error
 
     def __getattr__(self, name: str) -> Any:
         """Fall through to `mlflow` for attributes not defined on the logger.
@@ -102,6 +164,33 @@ class MlflowLogger(BaseExperimentLogger):
 
         return run_guarded
 
+    def log_record(self, record: dict[str, Any]) -> None:
+        """Log a flat record to the active run with a single batched request.
+
+        Numeric values are logged as metrics, every other value as a param;
+        non-string params are JSON-encoded. The batch is sent synchronously,
+        bypassing async logging, so that failures are raised to the caller.
+
+        Args:
+            record: Mapping of names to the values to log.
+        """
+        from mlflow.entities import Metric, Param
+
+        if self._run_id is None:
+            logger.warning("No active MLflow run. 'log_record' call ignored.")
+            return
+        timestamp = int(time.time() * 1000)
+        metrics: list[Metric] = []
+        params: list[Param] = []
+        for key, value in record.items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                metrics.append(Metric(key, float(value), timestamp, 0))
+            elif isinstance(value, str):
+                params.append(Param(key, value))
+            else:
+                params.append(Param(key, orjson.dumps(value, option=_ORJSON_OPTIONS).decode()))
+        self._client.log_batch(self._run_id, metrics=metrics, params=params, synchronous=True)
+
     @override
     def log_input(self, input_path: Path) -> None:
         """Log the input dataset to MLflow.
@@ -116,6 +205,8 @@ class MlflowLogger(BaseExperimentLogger):
         """
         if not input_path.exists():
             raise FileNotFoundError(f"The input path {input_path} does not exist.")
+        import mlflow.data.polars_dataset
+
         logger.info("Loading input data from %s", input_path)
         input_data = self._read_dataframe(input_path)
         dataset = mlflow.data.polars_dataset.from_polars(
@@ -126,29 +217,46 @@ class MlflowLogger(BaseExperimentLogger):
         mlflow.log_input(dataset=dataset)
 
     @override
-    def log_local_directory(self, local_dir: Path) -> None:
+    def log_local_directory(self, local_dir: Path, *, wait: bool = True) -> None:
         """Iterate over every file under `local_dir` and push it to MLflow.
 
+        Plain artifacts are uploaded concurrently. By default the call blocks
+        until they are all uploaded. With `wait=False` it returns as soon as
+        they are queued and the uploads are awaited in `__exit__`, so the files
+        must stay in place until the run is exited.
+
         Args:
             local_dir: The local directory whose contents to log.
+            wait: Whether to block until the plain artifact uploads are done.
         """
+        run_id, executor = self._run_id, self._upload_executor
+        if run_id is None or executor is None:
+            logger.warning("No active MLflow run. 'log_local_directory' call ignored.")
+            return
         local_dir = Path(local_dir)
-        if not local_dir.exists():
-            logger.warning("Local directory %s does not exist, skipping logging.", local_dir)
+        if not local_dir.is_dir():
+            logger.warning(
+                "Local directory %s does not exist or is not a directory, skipping logging.",
+                local_dir,
+            )
             return
-        local_dir_resolved = local_dir.resolve()
-        for file_path in sorted(local_dir.rglob("*")):
-            if not file_path.is_file():
-                continue
-            try:
-                rel_path = file_path.resolve().relative_to(local_dir_resolved)
-            except ValueError:
-                rel_path = Path(file_path.name)
-            self._dispatch_local_file(file_path, rel_path)
+        uploads: list[tuple[Path, Path]] = []
+        for file_path in self._iter_files(local_dir):
+            rel_path = file_path.relative_to(local_dir)
+            if not self._dispatch_local_file(run_id, file_path, rel_path):
+                uploads.append((file_path, rel_path))
+        queued = self._upload_artifacts(executor, run_id, uploads)
+        if wait:
+            self._wait_for_uploads(queued)
+        else:
+            self._pending_uploads.extend(queued)
 
     def _configure_tracking(self) -> str:
         """Configure MLflow tracking from `self._config`."""
-        dotenv.load_dotenv(override=True)
+        global mlflow
+        import mlflow
+
+        _load_dotenv_once()
         uri = str(self._config.tracking_uri)
         logger.info("Setting MLflow tracking URI to: %s", uri)
         mlflow.set_tracking_uri(uri)
@@ -169,43 +277,100 @@ class MlflowLogger(BaseExperimentLogger):
         except Exception:
             pass
         try:
-            from git import Repo
-
-            repo = Repo(search_parent_directories=True)
-            mlflow.set_tag("git_commit", repo.head.object.hexsha)
-            mlflow.set_tag("git_branch", repo.active_branch.name)
-        except Exception:
-            pass
+            commit, branch = self._read_git_head()
+        except (OSError, ValueError):
+            commit, branch = None, None
+        if commit is not None:
+            mlflow.set_tag("git_commit", commit)
+        if branch is not None:
+            mlflow.set_tag("git_branch", branch)
         mlflow.set_tag("run_host", os.uname().nodename)
         mlflow.set_tag("run_datetime", datetime.now().isoformat())
 
-    def _dispatch_local_file(self, file_path: Path, rel_path: Path) -> None:
-        """Send a single file to MLflow using the right call for its extension."""
-        suffix = file_path.suffix.lower()
-        artifact_dir = rel_path.parent.as_posix()
-        artifact_path = artifact_dir if artifact_dir not in ("", ".") else None
+    def _dispatch_local_file(self, run_id: str, file_path: Path, rel_path: Path) -> bool:
+        """Log a file through the handler registered for its extension, if any.
 
-        if suffix == ".json" and self._try_log_json_as_table(file_path, rel_path):
-            return
-        if suffix == ".jinja2":
-            self._log_jinja_as_text(file_path, rel_path, artifact_path)
-            return
-        mlflow.log_artifact(str(file_path), artifact_path=artifact_path)
+        Args:
+            run_id: The ID of the run to log to.
+            file_path: The path to the file to log.
+            rel_path: The path of the file relative to the logged directory.
+
+        Returns:
+            `True` if a handler logged the file, `False` if it still needs to be
+            uploaded as a plain artifact.
+        """
+        handler = self._file_handlers.get(file_path.suffix.lower())
+        return handler is not None and handler(run_id, file_path, rel_path)
+
+    def _upload_artifacts(
+        self, executor: ThreadPoolExecutor, run_id: str, uploads: list[tuple[Path, Path]]
+    ) -> list[tuple[Path, Future[None]]]:
+        """Submit plain file artifacts for upload to the run.
+
+        Uploads run on the run's executor through the tracking client with the
+        cached run ID, since the fluent API's active run is not visible from the
+        worker threads.
+
+        Args:
+            executor: The run's upload executor.
+            run_id: The ID of the run to upload to.
+            uploads: Pairs of local file path and path relative to the logged
+                directory.
+
+        Returns:
+            The relative path and future of each submitted upload.
+        """
+        return [
+            (rel_path, executor.submit(self._upload_artifact, run_id, file_path, rel_path))
+            for file_path, rel_path in uploads
+        ]
+
+    def _upload_artifact(self, run_id: str, file_path: Path, rel_path: Path) -> None:
+        """Upload a single file artifact; runs on the background executor."""
+        self._client.log_artifact(run_id, str(file_path), self._artifact_dir(rel_path))
         logger.info("Logged file artifact: %s", rel_path.as_posix())
 
-    def _try_log_json_as_table(self, file_path: Path, rel_path: Path) -> bool:
+    @staticmethod
+    def _wait_for_uploads(pending: list[tuple[Path, Future[None]]]) -> None:
+        """Block until every upload in `pending` is done.
+
+        Each failed upload is logged, and the first error is re-raised once
+        every upload has finished.
+
+        Args:
+            pending: The relative path and future of each submitted upload.
+        """
+        first_error: Exception | None = None
+        for rel_path, future in pending:
+            try:
+                future.result()
+            except Exception as e:
+                logger.error("Error uploading artifact %s: %s", rel_path.as_posix(), e)
+                if first_error is None:
+                    first_error = e
+        if first_error is not None:
+            raise first_error
+
+    def _try_log_json_as_table(self, run_id: str, file_path: Path, rel_path: Path) -> bool:
         """Try to log `file_path` as an MLflow table.
 
         The frame is read with polars but converted to pandas before logging,
-        since :func:`mlflow.log_table` only accepts `dict` or pandas frames.
+        since `MlflowClient.log_table` only accepts `dict` or pandas frames. A
+        single-record file is additionally logged through `log_record`, with
+        each key prefixed by the file's relative path without suffix (e.g.
+        `eval/metrics/acc`) so that records from different files do not clash.
+        The record is best-effort: if it is rejected, only the table is kept.
 
         Args:
+            run_id: The ID of the run to log to.
             file_path: The path to the JSON file to log.
             rel_path: The relative path to use for the logged artifact.
 
         Returns:
             `True` on success, `False` otherwise.
         """
+        import polars as pl
+
         try:
             dataset = pl.read_json(file_path)
         except Exception as e:
@@ -215,22 +380,97 @@ class MlflowLogger(BaseExperimentLogger):
             logger.debug("File %s read as empty dataframe; skipping table logging.", file_path)
             return False
         try:
-            mlflow.log_table(dataset.to_pandas(), artifact_file=rel_path.as_posix())
+            self._client.log_table(run_id, dataset.to_pandas(), artifact_file=rel_path.as_posix())
         except Exception as e:
             logger.error("Error logging %s as MLflow table: %s", file_path, e)
             return False
         logger.info("Logged table: %s", rel_path.as_posix())
+        if dataset.height == 1:
+            prefix = rel_path.with_suffix("").as_posix()
+            record = {f"{prefix}/{key}": value for key, value in dataset.row(0, named=True).items()}
+            try:
+                self.log_record(record)
+            except Exception as e:
+                logger.warning("Could not log %s as MLflow record: %s", file_path, e)
+            else:
+                logger.info("Logged record: %s", rel_path.as_posix())
+        return True
+
+    def _log_jinja_as_text(self, run_id: str, file_path: Path, rel_path: Path) -> bool:
+        """Log a Jinja2 template's contents as a `.txt` artifact of the run."""
+        artifact_file = f"{rel_path.as_posix()}.txt"
+        self._client.log_text(run_id, file_path.read_text(), artifact_file)
+        logger.info("Logged jinja template as text: %s", artifact_file)
         return True
 
-    def _log_jinja_as_text(
-        self, file_path: Path, rel_path: Path, artifact_path: str | None
-    ) -> None:
-        """Copy a Jinja2 template to a `.txt` sibling and log it as an artifact."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            txt_path = Path(tmpdir) / f"{file_path.name}.txt"
-            txt_path.write_text(file_path.read_text())
-            mlflow.log_artifact(str(txt_path), artifact_path=artifact_path)
-            logger.info("Logged jinja template as text: %s.txt", rel_path.as_posix())
+    @staticmethod
+    def _iter_files(root: Path) -> Iterator[Path]:
+        """Yield the regular files under `root`, depth first in name order.
+
+        `os.scandir` entries carry the file type from the directory listing, so
+        no extra `stat` call is needed per file. Symlinked directories are not
+        descended into, matching `Path.rglob`.
+        """
+        with os.scandir(root) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from MlflowLogger._iter_files(Path(entry.path))
+            elif entry.is_file():
+                yield Path(entry.path)
+
+    @staticmethod
+    def _artifact_dir(rel_path: Path) -> str | None:
+        """Return the artifact directory for `rel_path`, or `None` for the root."""
+        artifact_dir = rel_path.parent.as_posix()
+        return artifact_dir if artifact_dir != "." else None
+
+    @staticmethod
+    def _read_git_head() -> tuple[str | None, str | None]:
+        """Return the checked-out commit SHA and branch name of the enclosing repo.
+
+        Walks up from the working directory to the first `.git` entry and parses
+        `HEAD` and the ref it points to directly, rather than loading the repo
+        through GitPython. In a linked worktree the git directory only holds
+        `HEAD`; refs and `packed-refs` are read from the directory named by its
+        `commondir` file.
+
+        Returns:
+            The commit SHA and branch name. The branch is `None` on a detached
+            HEAD, and both are `None` outside a git repository or when the
+            nearest `.git` file points at a missing directory.
+        """
+        cwd = Path.cwd()
+        for directory in (cwd, *cwd.parents):
+            git_dir = directory / ".git"
+            if git_dir.is_file():
+                # Worktrees and submodules point at the real git directory.
+                git_dir = directory / git_dir.read_text().strip().removeprefix("gitdir: ")
+                if not git_dir.is_dir():
+                    return None, None
+            if git_dir.is_dir():
+                break
+        else:
+            return None, None
+        head = (git_dir / "HEAD").read_text().strip()
+        if not head.startswith("ref: "):
+            return head, None
+        ref = head.removeprefix("ref: ")
+        branch = ref.removeprefix("refs/heads/")
+        common_dir = git_dir
+        commondir_file = git_dir / "commondir"
+        if commondir_file.is_file():
+            common_dir = git_dir / commondir_file.read_text().strip()
+        ref_path = common_dir / ref
+        if ref_path.is_file():
+            return ref_path.read_text().strip(), branch
+        packed_refs = common_dir / "packed-refs"
+        if packed_refs.is_file():
+            for line in packed_refs.read_text().splitlines():
+                sha, _, name = line.partition(" ")
+                if name == ref:
+                    return sha, branch
+        return None, branch
 
     @staticmethod
     def _generate_run_name() -> str:
@@ -255,12 +495,10 @@ class MlflowLogger(BaseExperimentLogger):
             ValueError: If the file suffix is not one of the supported formats.
         """
         suffix = input_path.suffix.lower()
-        if suffix == ".json":
-            return pl.read_json(input_path)
-        if suffix == ".csv":
-            return pl.read_csv(input_path)
-        if suffix == ".parquet":
-            return pl.read_parquet(input_path)
-        raise ValueError(
-            f"Unsupported file format: {suffix!r}. Only .json, .csv, and .parquet are supported."
-        )
+        reader = _dataframe_readers().get(suffix)
+        if reader is None:
+            raise ValueError(
+                f"Unsupported file format: {suffix!r}. "
+                "Only .json, .csv, and .parquet are supported."
+            )
+        return reader(input_path)